@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the backtester's Numba kernels.
+
+Builds the backtester_kernels extension module next to backtester.py so
+one-shot CLI runs skip the JIT compile on first call. The exported entry
+points are type-strict: unlike the JIT kernels they don't check or convert
+their arguments, so callers must pass exactly the declared dtypes (the
+wrappers in backtester.py coerce their inputs first).
+
+The extension records a hash of the kernel source. backtester.py ignores it,
+with a warning, once _ma_crossover or _simulate change, and falls back to
+the JIT kernels until this script is re-run.
+
+Usage:
+    python _compile.py
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+import backtester
+
+cc = CC("backtester_kernels")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+KERNEL_HASH = backtester._kernel_source_hash()
+
+
+@cc.export("kernel_hash", "i8()")
+def kernel_hash():
+    return KERNEL_HASH
+
+
+cc.export(
+    "ma_crossover",
+    "Tuple((f4[:], f4[:], i1[:], i1[:]))(f4[:], i8, i8)"
+)(backtester._ma_crossover.py_func)
+
+cc.export(
+    "simulate",
+    "Tuple((i1[:], i8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8, f8))(f8[:], i1[:], f8)"
+)(backtester._simulate.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -6,124 +6,333 @@ Fetches historical data and simulates a simple MA crossover trading strategy.
 """
 
 import argparse
-from datetime import datetime, timedelta
+import hashlib
+import inspect
+import warnings
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
+from numba import njit, prange
 
+try:
+    # Ahead-of-time compiled kernels, built with `python _compile.py`
+    import backtester_kernels as _aot
+except ImportError:
+    _aot = None
+
+
+CACHE_DIR = Path.home() / ".cache" / "backtester"
+
+
+def _cache_file(ticker: str, period: str) -> Path:
+    """Parquet cache path for a ticker's download, valid for the current day."""
+    return CACHE_DIR / f"{ticker}_{period}_{date.today()}.parquet"
+
+
+def _write_cache(df: pd.DataFrame, ticker: str, period: str):
+    """
+    Cache a download and remove older-dated files for the same ticker/period.
+
+    Caching is best-effort: if the cache directory can't be written (read-only
+    or full disk), the download is simply not cached.
+    """
+    cache_file = _cache_file(ticker, period)
+    prefix = f"{ticker}_{period}_"
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_file, engine="pyarrow")
+        for old_file in CACHE_DIR.iterdir():
+            name = old_file.name
+            if (name != cache_file.name and name.startswith(prefix)
+                    and len(name) == len(cache_file.name)):
+                old_file.unlink()
+    except OSError:
+        # Don't leave a partially written file behind for the next run to read
+        try:
+            cache_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def fetch_data(ticker: str, period: str = "3y", use_cache: bool = True) -> pd.DataFrame:
+    """
+    Fetch historical daily data for a given ticker.
+
+    Downloads are cached as Parquet under CACHE_DIR for the rest of the day,
+    so repeated runs on the same ticker skip the network round-trip.
+    """
+    cache_file = _cache_file(ticker, period)
+    if use_cache and cache_file.exists():
+        return pd.read_parquet(cache_file, engine="pyarrow")
 
-def fetch_data(ticker: str, period: str = "3y") -> pd.DataFrame:
-    """Fetch historical daily data for a given ticker."""
     stock = yf.Ticker(ticker)
     df = stock.history(period=period)
     if df.empty:
         raise ValueError(f"No data found for ticker: {ticker}")
+
+    if use_cache:
+        _write_cache(df, ticker, period)
     return df
 
 
-def calculate_moving_averages(df: pd.DataFrame, short_window: int = 20, long_window: int = 50) -> pd.DataFrame:
-    """Calculate short and long moving averages."""
-    df = df.copy()
-    df["SMA_Short"] = df["Close"].rolling(window=short_window).mean()
-    df["SMA_Long"] = df["Close"].rolling(window=long_window).mean()
-    return df
+def fetch_data_multi(tickers: list, period: str = "3y", use_cache: bool = True) -> dict:
+    """
+    Fetch historical daily data for several tickers, keyed by ticker.
+
+    Tickers missing from the cache are downloaded together in one threaded
+    yf.download call rather than one request per ticker.
+    """
+    data = {}
+    missing = []
+    for ticker in tickers:
+        cache_file = _cache_file(ticker, period)
+        if use_cache and cache_file.exists():
+            data[ticker] = pd.read_parquet(cache_file, engine="pyarrow")
+        else:
+            missing.append(ticker)
+
+    if missing:
+        # Pinned rather than left to defaults that changed across yfinance
+        # versions: adjusted prices like Ticker.history, and (ticker, field)
+        # columns even when only one ticker is downloaded
+        downloaded = yf.download(missing, period=period, actions=True, auto_adjust=True,
+                                 group_by="ticker", multi_level_index=True,
+                                 threads=True, progress=False)
+        for ticker in missing:
+            if downloaded is None or ticker not in downloaded.columns.get_level_values(0):
+                raise ValueError(f"No data found for ticker: {ticker}")
+
+            # Drop the dates where only the other tickers traded
+            df = downloaded[ticker].dropna(how="all")
+            if df.empty:
+                raise ValueError(f"No data found for ticker: {ticker}")
+
+            if use_cache:
+                _write_cache(df, ticker, period)
+            data[ticker] = df
+
+    return {ticker: data[ticker] for ticker in tickers}
+
+
+@njit(cache=True, nogil=True)
+def _ma_crossover(prices: np.ndarray, short_window: int, long_window: int):
+    """
+    Moving averages, signals and crossovers in one streaming pass.
 
+    Both running sums are kept in float64 and updated by adding the newest
+    price and dropping the one that left each window. Non-finite prices are
+    left out of the sums and counted instead; an MA is NaN until its window
+    fills and while it holds a non-finite price, like rolling().mean(). The
+    signal is 0 whenever either MA is NaN.
+    """
+    n = len(prices)
+    sma_short = np.full(n, np.nan, dtype=np.float32)
+    sma_long = np.full(n, np.nan, dtype=np.float32)
+    signal = np.zeros(n, dtype=np.int8)
+    position = np.zeros(n, dtype=np.int8)
+    sum_short = 0.0
+    sum_long = 0.0
+    bad_short = 0
+    bad_long = 0
+
+    for i in range(n):
+        if np.isfinite(prices[i]):
+            sum_short += prices[i]
+            sum_long += prices[i]
+        else:
+            bad_short += 1
+            bad_long += 1
+        if i >= short_window:
+            if np.isfinite(prices[i - short_window]):
+                sum_short -= prices[i - short_window]
+            else:
+                bad_short -= 1
+        if i >= long_window:
+            if np.isfinite(prices[i - long_window]):
+                sum_long -= prices[i - long_window]
+            else:
+                bad_long -= 1
 
-def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
-    """Generate buy/sell signals based on MA crossover."""
-    df = df.copy()
-    df["Signal"] = 0
+        if i >= short_window - 1 and bad_short == 0:
+            sma_short[i] = sum_short / short_window
+        if i >= long_window - 1 and bad_long == 0:
+            sma_long[i] = sum_long / long_window
 
-    # 1 = buy signal (short crosses above long)
-    # -1 = sell signal (short crosses below long)
-    df.loc[df["SMA_Short"] > df["SMA_Long"], "Signal"] = 1
-    df.loc[df["SMA_Short"] <= df["SMA_Long"], "Signal"] = -1
+        # 1 = buy signal (short crosses above long)
+        # -1 = sell signal (short crosses below long)
+        if not (np.isnan(sma_short[i]) or np.isnan(sma_long[i])):
+            signal[i] = 1 if sma_short[i] > sma_long[i] else -1
 
-    # Detect crossover points (signal changes)
-    df["Position"] = df["Signal"].diff()
+        # Detect crossover points (signal changes)
+        if i > 0:
+            position[i] = signal[i] - signal[i - 1]
 
-    return df
+    return sma_short, sma_long, signal, position
 
 
-def simulate_trades(df: pd.DataFrame, initial_capital: float = 10000.0) -> dict:
+def compute_signals(close: np.ndarray, short_window: int = 20, long_window: int = 50):
     """
-    Simulate trades based on signals and calculate performance metrics.
+    Calculate both moving averages and the MA crossover signals together.
+
+    Returns (sma_short, sma_long, signal, position) as arrays aligned with close.
+    Signal is an int8 array that is 1 while the short MA is above the long MA,
+    -1 otherwise, and 0 while either MA is undefined (the warm-up bars, or a
+    window containing a NaN price); position is its bar-to-bar change.
 
-    Returns a dictionary with trade history and metrics.
+    Prices and moving averages are handled as float32, which is ample for
+    comparing MAs; the running sums are accumulated in float64.
     """
-    df = df.dropna().copy()
+    # The AOT kernel reads its arguments as exactly f4[:], i8, i8 without checking
+    prices = np.ascontiguousarray(close, dtype=np.float32)
+    ma_crossover = _aot.ma_crossover if _aot is not None else _ma_crossover
+    return ma_crossover(prices, int(short_window), int(long_window))
 
-    capital = initial_capital
-    shares = 0
-    trades = []
-    portfolio_values = []
 
+@njit(cache=True, nogil=True)
+def _simulate(close: np.ndarray, position: np.ndarray, initial_capital: float):
+    """
+    Run the trade state machine over the close prices in native code.
+
+    Trade types are encoded as 1 for BUY and -1 for SELL. Returns the trade
+    fields as parallel arrays along with the per-bar portfolio values and the
+    final share and cash holdings.
+    """
+    # Only crossover bars can trade; Position == 2 means signal changed from
+    # -1 to 1 (buy), -2 means it changed from 1 to -1 (sell)
+    events = np.flatnonzero(np.abs(position) == 2)
+
+    n = len(events)
+    trade_types = np.empty(n, dtype=np.int8)
+    trade_idx = np.empty(n, dtype=np.int64)
+    trade_shares = np.empty(n)
+    trade_prices = np.empty(n)
+    trade_profits = np.empty(n)
+    trade_profit_pcts = np.empty(n)
+    portfolio_values = np.empty(len(close))
+
+    capital = initial_capital
+    shares = 0.0
     in_position = False
-    entry_price = 0
-    entry_date = None
+    entry_price = 0.0
+    num_trades = 0
+    next_bar = 0
 
-    for date, row in df.iterrows():
-        current_price = row["Close"]
+    for i in events:
+        # Holdings are unchanged since the previous event, so value the bars
+        # up to and including this one in a single slice
+        portfolio_values[next_bar:i + 1] = capital + shares * close[next_bar:i + 1]
+        next_bar = i + 1
 
-        # Calculate current portfolio value
-        portfolio_value = capital + (shares * current_price)
-        portfolio_values.append({"Date": date, "Value": portfolio_value})
+        current_price = close[i]
 
-        # Buy signal: Position == 2 means signal changed from -1 to 1
-        if row["Position"] == 2 and not in_position:
+        if position[i] == 2 and not in_position:
             shares = capital // current_price
             if shares > 0:
-                cost = shares * current_price
-                capital -= cost
+                capital -= shares * current_price
                 in_position = True
                 entry_price = current_price
-                entry_date = date
-                trades.append({
-                    "Type": "BUY",
-                    "Date": date,
-                    "Price": current_price,
-                    "Shares": shares
-                })
-
-        # Sell signal: Position == -2 means signal changed from 1 to -1
-        elif row["Position"] == -2 and in_position:
-            revenue = shares * current_price
-            capital += revenue
-            profit = (current_price - entry_price) * shares
-            profit_pct = (current_price - entry_price) / entry_price * 100
-
-            trades.append({
-                "Type": "SELL",
-                "Date": date,
-                "Price": current_price,
-                "Shares": shares,
-                "Profit": profit,
-                "Profit_Pct": profit_pct
-            })
-
-            shares = 0
+                trade_types[num_trades] = 1
+                trade_idx[num_trades] = i
+                trade_shares[num_trades] = shares
+                trade_prices[num_trades] = current_price
+                trade_profits[num_trades] = np.nan
+                trade_profit_pcts[num_trades] = np.nan
+                num_trades += 1
+
+        elif position[i] == -2 and in_position:
+            capital += shares * current_price
+            trade_types[num_trades] = -1
+            trade_idx[num_trades] = i
+            trade_shares[num_trades] = shares
+            trade_prices[num_trades] = current_price
+            trade_profits[num_trades] = (current_price - entry_price) * shares
+            trade_profit_pcts[num_trades] = (current_price - entry_price) / entry_price * 100
+            num_trades += 1
+
+            shares = 0.0
             in_position = False
-            entry_price = 0
-            entry_date = None
+            entry_price = 0.0
+
+    portfolio_values[next_bar:] = capital + shares * close[next_bar:]
+
+    return (trade_types[:num_trades], trade_idx[:num_trades], trade_shares[:num_trades],
+            trade_prices[:num_trades], trade_profits[:num_trades], trade_profit_pcts[:num_trades],
+            portfolio_values, shares, capital)
+
+
+def _kernel_source_hash() -> int:
+    """Hash of the source of the AOT-exported kernels, used to detect a stale build."""
+    source = inspect.getsource(_ma_crossover.py_func) + inspect.getsource(_simulate.py_func)
+    return int(hashlib.sha256(source.encode()).hexdigest()[:15], 16)
+
+
+# Ignore a precompiled extension built from different kernel source
+if _aot is not None:
+    try:
+        _aot_is_current = _aot.kernel_hash() == _kernel_source_hash()
+    except (AttributeError, OSError):
+        _aot_is_current = False
+    if not _aot_is_current:
+        warnings.warn("backtester_kernels is out of date with backtester.py and is ignored; "
+                      "rebuild it with `python _compile.py`")
+        _aot = None
+
+
+def simulate_trades(close: np.ndarray, position: np.ndarray, dates: pd.DatetimeIndex,
+                    initial_capital: float = 10000.0, start: int = 0) -> dict:
+    """
+    Simulate trades based on signals and calculate performance metrics.
+
+    Takes the close prices, crossover positions from compute_signals and
+    their dates as aligned arrays, trading from bar `start` onwards (pass
+    long_window - 1 to skip the MA warm-up). Returns a dictionary with
+    trade history and metrics.
+    """
+    # The AOT kernel reads its arguments as exactly f8[:], i1[:], f8 without checking
+    close = np.ascontiguousarray(close[start:], dtype=np.float64)
+    position = np.ascontiguousarray(position[start:], dtype=np.int8)
+    dates = dates[start:]
+    initial_capital = float(initial_capital)
+
+    simulate = _aot.simulate if _aot is not None else _simulate
+
+    (trade_types, trade_idx, trade_shares, trade_prices, trade_profits, trade_profit_pcts,
+     portfolio_values, shares, capital) = simulate(close, position, initial_capital)
+
+    # Trade history as parallel arrays; Profit/Profit_Pct are NaN on BUY rows
+    trades = {
+        "Type": np.where(trade_types == 1, "BUY", "SELL"),
+        "Date": dates[trade_idx].tz_localize(None).to_numpy(),
+        "Price": trade_prices,
+        "Shares": trade_shares,
+        "Profit": trade_profits,
+        "Profit_Pct": trade_profit_pcts
+    }
+
+    in_position = shares > 0
 
     # Calculate final portfolio value
-    final_price = df.iloc[-1]["Close"]
+    final_price = close[-1]
     final_value = capital + (shares * final_price)
 
     # If still in position, calculate unrealized P&L
     if in_position:
+        entry_price = trade_prices[-1]
         unrealized_profit = (final_price - entry_price) * shares
         unrealized_pct = (final_price - entry_price) / entry_price * 100
     else:
         unrealized_profit = 0
         unrealized_pct = 0
 
-    portfolio_df = pd.DataFrame(portfolio_values)
+    portfolio_df = pd.DataFrame({"Value": portfolio_values}, index=dates)
 
     return {
         "trades": trades,
         "portfolio_df": portfolio_df,
+        "portfolio_values": portfolio_values,
         "final_value": final_value,
         "initial_capital": initial_capital,
         "shares_held": shares,
@@ -134,10 +343,65 @@ def simulate_trades(df: pd.DataFrame, initial_capital: float = 10000.0) -> dict:
     }
 
 
+@njit(cache=True, nogil=True, parallel=True)
+def _simulate_grid(close: np.ndarray, positions: np.ndarray, signals: np.ndarray, initial_capital: float):
+    """
+    Simulate each column of a (T, P) position matrix independently.
+
+    Column p only trades on the bars where signals[:, p] is non-zero, i.e.
+    where both of its moving averages are defined. Parameter columns are
+    spread across threads; returns the final value, trade count, win rate
+    and max drawdown of every column as (P,) arrays.
+    """
+    num_params = positions.shape[1]
+    final_values = np.empty(num_params)
+    num_trades = np.zeros(num_params, dtype=np.int64)
+    win_rates = np.zeros(num_params)
+    max_drawdowns = np.zeros(num_params)
+
+    for p in prange(num_params):
+        defined = signals[:, p] != 0
+        column_close = close[defined]
+        if len(column_close) == 0:
+            final_values[p] = initial_capital
+            continue
+
+        (trade_types, _, _, _, trade_profits, _,
+         portfolio_values, shares, capital) = _simulate(column_close, positions[:, p][defined], initial_capital)
+
+        final_values[p] = capital + shares * column_close[-1]
+
+        wins = 0
+        for k in range(len(trade_types)):
+            if trade_types[k] == -1:
+                num_trades[p] += 1
+                if trade_profits[k] > 0:
+                    wins += 1
+        if num_trades[p] > 0:
+            win_rates[p] = wins / num_trades[p] * 100
+
+        # Skip NaN values, as _max_drawdown does
+        peak = -np.inf
+        for value in portfolio_values:
+            if np.isnan(value):
+                continue
+            peak = max(peak, value)
+            max_drawdowns[p] = min(max_drawdowns[p], (value - peak) / peak)
+        max_drawdowns[p] *= 100
+
+    return final_values, num_trades, win_rates, max_drawdowns
+
+
+def _max_drawdown(values: np.ndarray) -> float:
+    """Largest peak-to-trough decline of a value series, in percent, skipping NaN values."""
+    peak = np.fmax.accumulate(values)
+    return np.nanmin((values - peak) / peak) * 100
+
+
 def calculate_metrics(results: dict) -> dict:
     """Calculate performance metrics from trade results."""
     trades = results["trades"]
-    portfolio_df = results["portfolio_df"]
+    portfolio_values = results["portfolio_values"]
     initial_capital = results["initial_capital"]
     final_value = results["final_value"]
 
@@ -145,21 +409,18 @@ def calculate_metrics(results: dict) -> dict:
     total_return = (final_value - initial_capital) / initial_capital * 100
 
     # Count trades (round trips)
-    sell_trades = [t for t in trades if t["Type"] == "SELL"]
-    num_trades = len(sell_trades)
+    sell_mask = trades["Type"] == "SELL"
+    num_trades = int(sell_mask.sum())
 
     # Win rate
     if num_trades > 0:
-        winning_trades = len([t for t in sell_trades if t["Profit"] > 0])
-        win_rate = winning_trades / num_trades * 100
+        win_rate = (trades["Profit"][sell_mask] > 0).mean() * 100
     else:
         win_rate = 0
 
     # Max drawdown
-    if not portfolio_df.empty:
-        portfolio_df["Peak"] = portfolio_df["Value"].cummax()
-        portfolio_df["Drawdown"] = (portfolio_df["Value"] - portfolio_df["Peak"]) / portfolio_df["Peak"] * 100
-        max_drawdown = portfolio_df["Drawdown"].min()
+    if len(portfolio_values) > 0:
+        max_drawdown = _max_drawdown(portfolio_values)
     else:
         max_drawdown = 0
 
@@ -173,10 +434,10 @@ def calculate_metrics(results: dict) -> dict:
     }
 
 
-def calculate_buy_and_hold(df: pd.DataFrame, initial_capital: float = 10000.0) -> dict:
-    """Calculate buy-and-hold performance metrics."""
-    start_price = df.iloc[0]["Close"]
-    end_price = df.iloc[-1]["Close"]
+def calculate_buy_and_hold(close: np.ndarray, initial_capital: float = 10000.0) -> dict:
+    """Calculate buy-and-hold performance metrics from the close prices."""
+    start_price = close[0]
+    end_price = close[-1]
 
     # Buy as many shares as possible on day 1
     shares = initial_capital // start_price
@@ -188,10 +449,8 @@ def calculate_buy_and_hold(df: pd.DataFrame, initial_capital: float = 10000.0) -
     total_return = (final_value - initial_capital) / initial_capital * 100
 
     # Calculate max drawdown for buy-and-hold
-    portfolio_values = (shares * df["Close"]) + remaining_cash
-    peak = portfolio_values.cummax()
-    drawdown = (portfolio_values - peak) / peak * 100
-    max_drawdown = drawdown.min()
+    portfolio_values = (shares * close) + remaining_cash
+    max_drawdown = _max_drawdown(portfolio_values)
 
     return {
         "start_price": start_price,
@@ -258,14 +517,15 @@ def print_summary(ticker: str, metrics: dict, results: dict, buy_hold: dict, sho
     print("-" * 70)
 
     trades = results["trades"]
-    if trades:
-        for trade in trades:
-            date_str = trade["Date"].strftime("%Y-%m-%d")
-            if trade["Type"] == "BUY":
-                print(f"  {date_str}  BUY   {trade['Shares']:>4} shares @ ${trade['Price']:.2f}")
+    if len(trades["Type"]) > 0:
+        date_strs = np.datetime_as_string(trades["Date"], unit="D")
+        for i in range(len(trades["Type"])):
+            date_str = date_strs[i]
+            if trades["Type"][i] == "BUY":
+                print(f"  {date_str}  BUY   {trades['Shares'][i]:>4} shares @ ${trades['Price'][i]:.2f}")
             else:
-                print(f"  {date_str}  SELL  {trade['Shares']:>4} shares @ ${trade['Price']:.2f}  "
-                      f"P&L: ${trade['Profit']:+,.2f} ({trade['Profit_Pct']:+.2f}%)")
+                print(f"  {date_str}  SELL  {trades['Shares'][i]:>4} shares @ ${trades['Price'][i]:.2f}  "
+                      f"P&L: ${trades['Profit'][i]:+,.2f} ({trades['Profit_Pct'][i]:+.2f}%)")
     else:
         print("  No trades executed.")
 
@@ -273,19 +533,32 @@ def print_summary(ticker: str, metrics: dict, results: dict, buy_hold: dict, sho
 
 
 def run_backtest(ticker: str = "AAPL", short_window: int = 20, long_window: int = 50,
-                 initial_capital: float = 10000.0):
-    """Run the complete backtest pipeline."""
-    print(f"\nFetching 3 years of data for {ticker}...")
-    df = fetch_data(ticker)
+                 initial_capital: float = 10000.0, use_cache: bool = True, df: pd.DataFrame | None = None):
+    """Run the complete backtest pipeline, fetching the data unless df is given."""
+    if df is None:
+        print(f"\nFetching 3 years of data for {ticker}...")
+        df = fetch_data(ticker, use_cache=use_cache)
+    else:
+        print(f"\nBacktesting {ticker}...")
     print(f"Retrieved {len(df)} trading days of data.")
 
+    # Extracted once and shared by every stage below (a view for float64 data)
+    close = df["Close"].to_numpy(dtype=np.float64, copy=False)
+
     # Calculate buy-and-hold benchmark
-    buy_hold = calculate_buy_and_hold(df, initial_capital)
+    buy_hold = calculate_buy_and_hold(close, initial_capital)
 
-    df = calculate_moving_averages(df, short_window, long_window)
-    df = generate_signals(df)
+    sma_short, sma_long, signal, position = compute_signals(close, short_window, long_window)
 
-    results = simulate_trades(df, initial_capital)
+    # Only trade on bars where both moving averages are defined. Past the
+    # warm-up that is every bar unless a NaN price leaves a gap.
+    start = long_window - 1
+    defined = signal[start:] != 0
+    if defined.all():
+        results = simulate_trades(close, position, df.index, initial_capital, start=start)
+    else:
+        results = simulate_trades(close[start:][defined], position[start:][defined],
+                                  df.index[start:][defined], initial_capital)
     metrics = calculate_metrics(results)
 
     print_summary(ticker, metrics, results, buy_hold, short_window, long_window)
@@ -293,16 +566,57 @@ def run_backtest(ticker: str = "AAPL", short_window: int = 20, long_window: int
     return metrics, results, buy_hold
 
 
+def run_backtest_grid(ticker: str = "AAPL", shorts=(10, 20, 30), longs=(50, 100, 200),
+                      initial_capital: float = 10000.0, use_cache: bool = True) -> dict:
+    """
+    Backtest every (short, long) window combination with short < long.
+
+    Signals for all combinations are stacked as columns of a (T, P) matrix and
+    simulated in parallel. Returns a dict of (P,) arrays, one entry per
+    combination.
+    """
+    df = fetch_data(ticker, use_cache=use_cache)
+    close = df["Close"].to_numpy(dtype=np.float64, copy=False)
+
+    pairs = [(s, l) for s in shorts for l in longs if s < l <= len(close)]
+    if not pairs:
+        raise ValueError(f"No (short, long) combination with short < long <= {len(close)} days")
+
+    short_windows = np.array([s for s, _ in pairs])
+    long_windows = np.array([l for _, l in pairs])
+
+    signals = np.empty((len(close), len(pairs)), dtype=np.int8)
+    positions = np.empty((len(close), len(pairs)), dtype=np.int8)
+    for p, (s, l) in enumerate(pairs):
+        _, _, signals[:, p], positions[:, p] = compute_signals(close, s, l)
+
+    # Each column skips the bars where its moving averages are undefined
+    final_values, num_trades, win_rates, max_drawdowns = _simulate_grid(close, positions, signals, initial_capital)
+
+    return {
+        "short_window": short_windows,
+        "long_window": long_windows,
+        "total_return": (final_values - initial_capital) / initial_capital * 100,
+        "num_trades": num_trades,
+        "win_rate": win_rates,
+        "max_drawdown": max_drawdowns,
+        "final_value": final_values,
+        "initial_capital": initial_capital
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Stock Backtester with MA Crossover Strategy")
-    parser.add_argument("--ticker", "-t", type=str, default="AAPL",
-                        help="Stock ticker symbol (default: AAPL)")
+    parser.add_argument("--ticker", "-t", type=str, nargs="+", default=["AAPL"],
+                        help="Stock ticker symbol(s) (default: AAPL)")
     parser.add_argument("--short", "-s", type=int, default=20,
                         help="Short MA window in days (default: 20)")
     parser.add_argument("--long", "-l", type=int, default=50,
                         help="Long MA window in days (default: 50)")
     parser.add_argument("--capital", "-c", type=float, default=10000.0,
                         help="Initial capital in dollars (default: 10000)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always download fresh data instead of using the local cache")
 
     args = parser.parse_args()
 
@@ -310,7 +624,14 @@ def main():
         print("Error: Short window must be smaller than long window.")
         return
 
-    run_backtest(args.ticker, args.short, args.long, args.capital)
+    if len(args.ticker) == 1:
+        run_backtest(args.ticker[0], args.short, args.long, args.capital, use_cache=not args.no_cache)
+        return
+
+    print(f"\nFetching 3 years of data for {', '.join(args.ticker)}...")
+    data = fetch_data_multi(args.ticker, use_cache=not args.no_cache)
+    for ticker, df in data.items():
+        run_backtest(ticker, args.short, args.long, args.capital, df=df)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+"""Regression checks for NaN prices in the backtest pipeline."""
+
+import numpy as np
+import pandas as pd
+
+import backtester
+
+
+def make_prices(n: int = 750, nan_bars=(100,)) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    close[list(nan_bars)] = np.nan
+    index = pd.date_range("2022-01-03", periods=n, freq="B", tz="America/New_York")
+    return pd.DataFrame({"Close": close}, index=index)
+
+
+def test_moving_averages_recover_after_nan():
+    close = make_prices()["Close"]
+    sma_short, sma_long, signal, position = backtester.compute_signals(close.to_numpy(), 20, 50)
+
+    # Same NaN pattern as rolling().mean(): undefined only while a window holds the NaN
+    np.testing.assert_allclose(sma_short, close.rolling(20).mean(), rtol=1e-6)
+    np.testing.assert_allclose(sma_long, close.rolling(50).mean(), rtol=1e-6)
+
+    defined = ~np.isnan(sma_long)
+    assert np.all(signal[~defined] == 0)
+    assert np.all(np.abs(signal[defined]) == 1)
+    assert np.isfinite(sma_long[150:]).all()
+
+
+def test_backtest_trades_through_nan_bar(monkeypatch):
+    df = make_prices()
+    monkeypatch.setattr(backtester, "fetch_data", lambda *args, **kwargs: df)
+
+    metrics, results, buy_hold = backtester.run_backtest("TEST", 20, 50, 10000.0)
+
+    assert metrics["num_trades"] > 0
+    assert np.isfinite(metrics["final_value"])
+    assert np.isfinite(metrics["max_drawdown"])
+    assert np.isfinite(buy_hold["max_drawdown"])
+    assert not results["portfolio_df"].index.isin(df.index[100:150]).any()
+
+
+def test_max_drawdown_skips_nan():
+    values = np.array([100.0, 120.0, np.nan, 90.0, 110.0])
+    assert np.isclose(backtester._max_drawdown(values), -25.0)